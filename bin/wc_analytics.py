@@ -4,21 +4,54 @@ WriteControl Analytics Script
 Analyzes writing session data by reconstructing document state from recorded events.
 
 Usage:
-    wc-analytics.py analyze <log_file> [--all] [--dir DIR]
-    wc-analytics.py process <log_files...>
-    wc-analytics.py summary [--filename FILE] [--dir DIR]
-    wc-analytics.py list [--dir DIR] [--sort words|duration|date]
+    wc-analytics.py analyze <log_file> [--all] [--dir DIR] [--jobs N]
+    wc-analytics.py process <log_files...> [--jobs N]
+    wc-analytics.py summary [--filename FILE] [--dir DIR] [--jobs N]
+    wc-analytics.py list [--dir DIR] [--sort words|duration|date] [--jobs N]
 """
 
 import json
 import sys
 import os
 import re
-from datetime import datetime
+from time import localtime, strftime
 import argparse
-from pathlib import Path
-from collections import defaultdict
-from typing import List, Dict, Tuple, Optional
+import functools
+from collections import Counter, defaultdict
+from operator import itemgetter
+from array import array
+from itertools import chain, islice
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator
+
+try:
+    import orjson
+
+    def _loads(data: bytes):
+        """Parse JSON with orjson, deferring to json for what it rejects"""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. lone surrogate escapes, which json.dump writes for
+            # surrogateescape-decoded buffer text
+            return json.loads(data)
+except ImportError:
+    _loads = json.loads
+
+# Equivalent to r'\b\w+\b': a greedy \w run always ends on word boundaries
+_WORD_RE = re.compile(r'\w+')
+_SENTENCE_RE = re.compile(r'[^.!?\s][^.!?]*')
+_NEWLINES_RE = re.compile(r'\[(\d+) new lines?\]')
+_DELLINES_RE = re.compile(r'\[(\d+) deleted lines?\]')
+_FILENAME_RE = re.compile(rb'"filename"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# The plugin writes 'filename' as the first key, so a small prefix is enough
+_SNIFF_BYTES = 4096
+
+# Logs handed to each worker at a time when analyzing in parallel
+_POOL_CHUNKSIZE = 8
+
+# Tracked files larger than this are not used as initial content
+_MAX_INITIAL_BYTES = 10 * 1024 * 1024
 
 def parse_position(pos: int) -> Tuple[int, int]:
     """Convert encoded position back to (line, col)"""
@@ -35,12 +68,27 @@ class DocumentState:
         self.lines = initial_content.split('\n') if initial_content else ['']
         self.cursor_line = 1
         self.cursor_col = 0
+        # Text typed at the end of the cursor line, not yet joined into it
+        self._pending = []
+        self._pending_len = 0
+
+    def _flush(self):
+        """Join buffered end-of-line typing into the cursor line"""
+        if self._pending:
+            self.lines[self.cursor_line - 1] += ''.join(self._pending)
+            self._pending = []
+            self._pending_len = 0
 
     def get_content(self) -> str:
+        self._flush()
         return '\n'.join(self.lines)
 
     def set_cursor(self, line: int, col: int):
         """Update cursor position (1-based line, 0-based col)"""
+        if self._pending:
+            if line == self.cursor_line and col == self.cursor_col:
+                return
+            self._flush()
         self.cursor_line = max(1, min(line, len(self.lines)))
         line_len = len(self.lines[self.cursor_line - 1])
         self.cursor_col = max(0, min(col, line_len))
@@ -50,18 +98,27 @@ class DocumentState:
         if not content:
             return
 
+        # Typing at the end of the line is the common case; buffer it
+        # rather than copying the whole line on every keystroke
+        if (content[0] not in '[\r\n' and
+                self.cursor_col == len(self.lines[self.cursor_line - 1]) + self._pending_len):
+            self._pending.append(content)
+            self._pending_len += len(content)
+            self.cursor_col += len(content)
+            return
+
+        self._flush()
         line_idx = self.cursor_line - 1
         line = self.lines[line_idx]
 
         # Handle special content markers
         if content.startswith('[') and content.endswith(']'):
             # Multi-line additions like "[3 new lines]"
-            match = re.match(r'\[(\d+) new lines?\]', content)
+            match = _NEWLINES_RE.match(content)
             if match:
                 new_line_count = int(match.group(1))
                 # Insert new lines after current
-                for _ in range(new_line_count):
-                    self.lines.insert(line_idx + 1, '')
+                self.lines[line_idx + 1:line_idx + 1] = [''] * new_line_count
                 self.cursor_line += 1
                 self.cursor_col = 0
                 return
@@ -86,17 +143,16 @@ class DocumentState:
         if not content:
             return
 
+        self._flush()
         line_idx = self.cursor_line - 1
 
         # Handle special deletion markers
         if content.startswith('[') and content.endswith(']'):
-            match = re.match(r'\[(\d+) deleted lines?\]', content)
+            match = _DELLINES_RE.match(content)
             if match:
                 del_count = int(match.group(1))
                 # Delete lines starting from current
-                for _ in range(min(del_count, len(self.lines) - line_idx)):
-                    if line_idx < len(self.lines):
-                        del self.lines[line_idx]
+                del self.lines[line_idx:line_idx + del_count]
                 # Adjust cursor
                 if line_idx >= len(self.lines):
                     self.cursor_line = len(self.lines)
@@ -118,79 +174,95 @@ class DocumentState:
             self.cursor_line -= 1
             self.cursor_col = len(prev_line)
 
-def reconstruct_session(events: List[Dict], initial_content: str = "") -> Dict[str, DocumentState]:
-    """Reconstruct document states from events"""
+def event_columns(events: List[Dict]) -> Tuple[List[str], array, List[str]]:
+    """Split events into (types, positions, contents) columns
+
+    The columns are far smaller than the per-event dicts, so callers can
+    drop the events once these are built.
+    """
+    types = list(map(itemgetter('type'), events))
+    positions = array('q', [e.get('pos', 0) for e in events])
+    contents = [e.get('content', '') for e in events]
+    return types, positions, contents
+
+def replay_columns(types: List[str], positions: array, contents: List[str],
+                   initial_content: str = "") -> Dict[str, str]:
+    """Reconstruct document text from columns built by event_columns"""
     states = {}
     doc = DocumentState(initial_content)
 
-    # Store initial state
-    states['initial'] = DocumentState(initial_content)
+    # The initial text is never mutated, so keep the string itself
+    states['initial'] = initial_content
 
-    for event in events:
-        event_type = event['type']
-        pos = event.get('pos', 0)
-        content = event.get('content', '')
+    # Bind the per-event methods once rather than per iteration
+    set_cursor = doc.set_cursor
+    apply_keystroke = doc.apply_keystroke
+    apply_deletion = doc.apply_deletion
 
+    for event_type, pos, content in zip(types, positions, contents):
         # Update cursor position if changed
         if pos > 0:
-            line, col = parse_position(pos)
-            doc.set_cursor(line, col)
+            set_cursor(*parse_position(pos))
 
         # Apply event
         if event_type == 'k':  # Keystroke
-            doc.apply_keystroke(content)
+            apply_keystroke(content)
         elif event_type == 'd':  # Deletion
-            doc.apply_deletion(content)
+            apply_deletion(content)
         elif event_type == 's' and content == 'pre':
             # Snapshot state before save
-            states['pre_save'] = DocumentState(doc.get_content())
+            states['pre_save'] = doc.get_content()
         elif event_type == 'end':
             # Final state
-            states['final'] = DocumentState(doc.get_content())
+            states['final'] = doc.get_content()
 
     # Ensure we have final state
     if 'final' not in states:
-        states['final'] = doc
+        states['final'] = doc.get_content()
 
     return states
 
-def get_text_metrics(text: str) -> Dict[str, int]:
-    """Calculate metrics for given text"""
+def _tokenize(text: str) -> List[str]:
+    """Split text into word tokens"""
+    return _WORD_RE.findall(text)
+
+def get_text_metrics(text: str, words: Optional[List[str]] = None) -> Dict[str, int]:
+    """Calculate metrics for given text, reusing pre-tokenized words if given"""
     if not text:
         return {"words": 0, "sentences": 0, "paragraphs": 0}
 
     # Count non-empty paragraphs
-    paragraphs = [p for p in text.split('\n') if p.strip()]
+    paragraphs = sum(1 for p in text.split('\n') if p and not p.isspace())
 
-    # Count sentences (simple regex)
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s for s in sentences if s.strip()]
+    # Count sentences: runs of text between terminators with a non-space char
+    sentences = sum(1 for _ in _SENTENCE_RE.finditer(text))
 
     # Count words
-    words = re.findall(r'\b\w+\b', text)
+    if words is None:
+        words = _tokenize(text)
 
     return {
         "words": len(words),
-        "sentences": len(sentences),
-        "paragraphs": len(paragraphs)
+        "sentences": sentences,
+        "paragraphs": paragraphs
     }
 
-def calculate_similarity(text1: str, text2: str) -> float:
-    """Calculate Jaccard similarity between texts"""
-    if not text1 and not text2:
-        return 100.0
+def calculate_similarity_from_words(words1: List[str], words2: List[str]) -> float:
+    """Calculate case-insensitive Jaccard similarity between token lists"""
+    # Skip building sets when a side is empty, e.g. a session on a new file
+    if not words1 or not words2:
+        return 0.0 if words1 or words2 else 100.0
 
-    words1 = set(re.findall(r'\b\w+\b', text1.lower()))
-    words2 = set(re.findall(r'\b\w+\b', text2.lower()))
-
-    if not words1 and not words2:
-        return 100.0
+    words1 = {w.lower() for w in words1}
+    words2 = {w.lower() for w in words2}
 
     intersection = len(words1 & words2)
-    union = len(words1 | words2)
+    # Inclusion-exclusion, so the union set is never built
+    union = len(words1) + len(words2) - intersection
 
     return round((intersection / union) * 100, 1) if union > 0 else 100.0
 
+@functools.lru_cache(maxsize=512)
 def format_time(ms: int) -> str:
     """Format milliseconds to human readable"""
     seconds = ms / 1000
@@ -204,11 +276,26 @@ def format_time(ms: int) -> str:
     else:
         return f"{seconds:.1f}s"
 
-def analyze_session(log_path: str) -> Optional[Dict]:
-    """Analyze a single session log"""
+@functools.lru_cache(maxsize=8)
+def _read_initial_content(path: str, mtime_ns: int, size: int) -> Tuple[str, List[str]]:
+    """Read and tokenize a tracked file, shared by every session of it
+
+    Keyed on mtime and size so edits invalidate the entry. The returned
+    word list is shared between callers and must not be mutated.
+    """
+    with open(path, 'r') as f:
+        content = f.read()
+    return content, _tokenize(content)
+
+def analyze_session(log_path: str, lite: bool = False) -> Optional[Dict]:
+    """Analyze a single session log
+
+    With lite=True the sentence and paragraph scans are skipped, so the
+    metrics and changes hold word counts only.
+    """
     try:
-        with open(log_path, 'r') as f:
-            data = json.load(f)
+        with open(log_path, 'rb') as f:
+            data = _loads(f.read())
     except Exception as e:
         print(f"Error reading {log_path}: {e}")
         return None
@@ -217,52 +304,55 @@ def analyze_session(log_path: str) -> Optional[Dict]:
     base_filename = os.path.basename(filename)
     start_time = data['start_time'] / 1000
 
-    events = sorted(data['events'], key=lambda e: e['dt'])
+    events = sorted(data.pop('events'), key=itemgetter('dt'))
     if not events:
         return None
 
     session_duration_ms = events[-1]['dt']
 
+    # Keep only the columns the replay needs and free the event dicts
+    types, positions, contents = event_columns(events)
+    del events
+
     # Try to get initial content from file or use empty
     initial_content = ""
+    initial_words = []
     try:
         # Only use file content if it exists and session is recent
-        if os.path.exists(filename):
-            file_mtime = os.path.getmtime(filename)
-            session_end_time = start_time + (session_duration_ms / 1000)
-            # If file was modified within an hour of session end, might be reliable
-            if abs(file_mtime - session_end_time) < 3600:
-                with open(filename, 'r') as f:
-                    initial_content = f.read()
+        st = os.stat(filename)
+        session_end_time = start_time + (session_duration_ms / 1000)
+        # If file was modified within an hour of session end, might be reliable
+        if abs(st.st_mtime - session_end_time) < 3600 and st.st_size <= _MAX_INITIAL_BYTES:
+            initial_content, initial_words = _read_initial_content(
+                filename, st.st_mtime_ns, st.st_size)
     except:
         pass
 
     # Reconstruct states from events
-    states = reconstruct_session(events, initial_content)
+    states = replay_columns(types, positions, contents, initial_content)
 
-    initial_text = states['initial'].get_content()
-    final_text = states['final'].get_content()
+    initial_text = states['initial']
+    final_text = states['final']
 
     # Calculate metrics
-    initial_metrics = get_text_metrics(initial_text)
-    final_metrics = get_text_metrics(final_text)
-
-    changes = {
-        "words": final_metrics["words"] - initial_metrics["words"],
-        "sentences": final_metrics["sentences"] - initial_metrics["sentences"],
-        "paragraphs": final_metrics["paragraphs"] - initial_metrics["paragraphs"]
-    }
+    final_words = _tokenize(final_text)
+    if lite:
+        initial_metrics = {"words": len(initial_words)}
+        final_metrics = {"words": len(final_words)}
+    else:
+        initial_metrics = get_text_metrics(initial_text, initial_words)
+        final_metrics = get_text_metrics(final_text, final_words)
 
-    similarity = calculate_similarity(initial_text, final_text)
+    similarity = calculate_similarity_from_words(initial_words, final_words)
     change_percentage = 100 - similarity
 
+    changes = {key: final_metrics[key] - initial_metrics[key] for key in initial_metrics}
+
     # Mode durations
     mode_durations = data.get('mode_durations', {})
 
     # Count different event types
-    event_counts = defaultdict(int)
-    for event in events:
-        event_counts[event['type']] += 1
+    event_counts = Counter(types)
 
     # Calculate typing speed in insert mode
     insert_ms = mode_durations.get('i', 0)
@@ -274,7 +364,8 @@ def analyze_session(log_path: str) -> Optional[Dict]:
     return {
         "filename": base_filename,
         "full_path": filename,
-        "session_date": datetime.fromtimestamp(start_time).strftime('%Y-%m-%d %H:%M'),
+        "start_time": start_time,
+        "session_date": strftime('%Y-%m-%d %H:%M', localtime(start_time)),
         "session_duration_ms": session_duration_ms,
         "session_duration": format_time(session_duration_ms),
         "mode_durations": mode_durations,
@@ -289,25 +380,78 @@ def analyze_session(log_path: str) -> Optional[Dict]:
         "log_path": log_path
     }
 
-def find_sessions(log_dir: str, filename: Optional[str] = None) -> List[str]:
-    """Find session logs, optionally filtered by filename"""
-    logs = []
+def read_log_filename(log_path: str) -> str:
+    """Read the tracked filename from a log without parsing its events"""
+    with open(log_path, 'rb') as f:
+        head = f.read(_SNIFF_BYTES)
+        match = _FILENAME_RE.search(head)
+        if match:
+            return json.loads(b'"' + match.group(1) + b'"')
+        # Field not in the prefix; fall back to a full parse
+        return _loads(head + f.read())['filename']
+
+def iter_sessions(log_dir: str, filename: Optional[str] = None) -> Iterator[str]:
+    """Yield session logs oldest first, optionally filtered by filename
+
+    Only the directory listing is collected up front; the filename filter
+    is applied lazily so callers can start analyzing early matches.
+    """
+    try:
+        it = os.scandir(log_dir or '.')
+    except OSError:
+        return
+
+    entries = []
+    with it:
+        for e in it:
+            if not e.name.endswith('.json') or not e.is_file():
+                continue
+            try:
+                st = e.stat()
+            except OSError:
+                # Removed or unreadable since the listing
+                continue
+            # Empty logs (e.g. from an interrupted write) hold no session
+            if st.st_size:
+                entries.append((st.st_mtime, e.path))
 
-    for log_file in Path(log_dir).glob("*.json"):
+    # Sort by modification time
+    entries.sort()
+
+    for _, log_file in entries:
         if filename:
             try:
-                with open(log_file, 'r') as f:
-                    data = json.load(f)
-                if os.path.basename(data['filename']) != filename:
+                if os.path.basename(read_log_filename(log_file)) != filename:
                     continue
             except:
                 continue
 
-        logs.append(str(log_file))
+        yield log_file
 
-    # Sort by modification time
-    logs.sort(key=lambda x: os.path.getmtime(x))
-    return logs
+def find_sessions(log_dir: str, filename: Optional[str] = None) -> List[str]:
+    """Find session logs, optionally filtered by filename"""
+    return list(iter_sessions(log_dir, filename))
+
+def analyze_sessions(logs: Iterable[str], jobs: Optional[int] = None,
+                     lite: bool = False) -> List[Dict]:
+    """Analyze several session logs, in parallel when jobs allows"""
+    analyze = functools.partial(analyze_session, lite=lite)
+    jobs = jobs or os.cpu_count() or 1
+
+    # A pool only pays off once there is more than one chunk of work
+    logs = iter(logs)
+    head = list(islice(logs, _POOL_CHUNKSIZE + 1))
+    logs = chain(head, logs)
+
+    if jobs <= 1 or len(head) <= _POOL_CHUNKSIZE:
+        sessions = map(analyze, logs)
+    else:
+        # Imported here: multiprocessing adds noticeable startup time and
+        # most runs (e.g. a commit hook over a few logs) never need it
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            sessions = list(executor.map(analyze, logs, chunksize=_POOL_CHUNKSIZE))
+    return [s for s in sessions if s]
 
 def print_session_report(session: Dict, accumulated: Optional[Dict] = None):
     """Print formatted session report"""
@@ -353,16 +497,31 @@ def generate_commit_message(file_sessions: Dict[str, List[Dict]]) -> str:
     if not file_sessions:
         return "Update"
 
+    # Aggregate every file's sessions in a single pass
+    file_totals = {}
+    total_words = 0
+    total_duration_ms = 0
+    for filename, sessions in file_sessions.items():
+        words = 0
+        duration_ms = 0
+        new_file = True
+        for s in sessions:
+            words += s['changes']['words']
+            duration_ms += s['session_duration_ms']
+            if s['initial_metrics']['words'] != 0:
+                new_file = False
+        file_totals[filename] = (words, new_file)
+        total_words += words
+        total_duration_ms += duration_ms
+
     # Single file
     if len(file_sessions) == 1:
-        filename, sessions = list(file_sessions.items())[0]
+        filename, sessions = next(iter(file_sessions.items()))
         base_name = os.path.basename(filename)
-
-        total_words = sum(s['changes']['words'] for s in sessions)
-        total_duration_ms = sum(s['session_duration_ms'] for s in sessions)
+        new_file = file_totals[filename][1]
 
         # New file
-        if all(s['initial_metrics']['words'] == 0 for s in sessions):
+        if new_file:
             final_words = sessions[-1]['final_metrics']['words']
             return f"New file {base_name}: {final_words} words, {format_time(total_duration_ms)}"
 
@@ -385,15 +544,12 @@ def generate_commit_message(file_sessions: Dict[str, List[Dict]]) -> str:
 
     # Multiple files
     file_count = len(file_sessions)
-    total_words = sum(sum(s['changes']['words'] for s in sessions) for sessions in file_sessions.values())
-    total_duration_ms = sum(sum(s['session_duration_ms'] for s in sessions) for sessions in file_sessions.values())
 
     # Short summary for 3 or fewer files
     if file_count <= 3:
         summaries = []
-        for filename, sessions in file_sessions.items():
+        for filename, (words, _) in file_totals.items():
             base_name = os.path.basename(filename)
-            words = sum(s['changes']['words'] for s in sessions)
             if words != 0:
                 summaries.append(f"{base_name} ({words:+d}w)")
 
@@ -422,36 +578,37 @@ def cmd_analyze(args):
     if args.all:
         # Get log directory
         log_dir = os.path.dirname(args.log_file)
-        target_file = os.path.basename(session['full_path'])
-
-        all_logs = find_sessions(log_dir, target_file)
-        all_sessions = []
-        for log in all_logs:
-            s = analyze_session(log)
-            if s:
-                all_sessions.append(s)
-
-        # Accumulate stats
-        if all_sessions:
-            total_duration_ms = sum(s['session_duration_ms'] for s in all_sessions)
-            total_words_added = sum(max(0, s['changes']['words']) for s in all_sessions)
-            total_keystrokes = sum(s['event_counts'].get('k', 0) for s in all_sessions)
-            total_insert_ms = sum(s['mode_durations'].get('i', 0) for s in all_sessions)
-
-            avg_speed = 0
-            if total_insert_ms > 0:
-                avg_speed = total_keystrokes / (total_insert_ms / 60000)
-
-            accumulated = {
-                'total_sessions': len(all_sessions),
-                'total_duration': format_time(total_duration_ms),
-                'total_words_added': total_words_added,
-                'avg_typing_speed': avg_speed
-            }
-
-            print_session_report(session, accumulated)
-        else:
-            print_session_report(session)
+        target_file = session['filename']
+
+        # The current log is already analyzed; only the others need work
+        current_log = os.path.normpath(args.log_file)
+        other_logs = [log for log in find_sessions(log_dir, target_file)
+                      if os.path.normpath(log) != current_log]
+        all_sessions = [session] + analyze_sessions(other_logs, args.jobs, lite=True)
+
+        # Accumulate stats in a single pass over the sessions
+        total_duration_ms = 0
+        total_words_added = 0
+        total_keystrokes = 0
+        total_insert_ms = 0
+        for s in all_sessions:
+            total_duration_ms += s['session_duration_ms']
+            total_words_added += max(0, s['changes']['words'])
+            total_keystrokes += s['event_counts'].get('k', 0)
+            total_insert_ms += s['mode_durations'].get('i', 0)
+
+        avg_speed = 0
+        if total_insert_ms > 0:
+            avg_speed = total_keystrokes / (total_insert_ms / 60000)
+
+        accumulated = {
+            'total_sessions': len(all_sessions),
+            'total_duration': format_time(total_duration_ms),
+            'total_words_added': total_words_added,
+            'avg_typing_speed': avg_speed
+        }
+
+        print_session_report(session, accumulated)
     else:
         print_session_report(session)
 
@@ -461,10 +618,8 @@ def cmd_process(args):
     """Process command for commit messages"""
     file_sessions = defaultdict(list)
 
-    for log_file in args.log_files:
-        session = analyze_session(log_file)
-        if session:
-            file_sessions[session['full_path']].append(session)
+    for session in analyze_sessions(args.log_files, args.jobs, lite=True):
+        file_sessions[session['full_path']].append(session)
 
     msg = generate_commit_message(dict(file_sessions))
     print(f"Commit message: {msg}")
@@ -474,8 +629,8 @@ def cmd_summary(args):
     """Summary command"""
     log_dir = args.dir or get_default_log_dir()
 
-    logs = find_sessions(log_dir, args.filename)
-    if not logs:
+    sessions = analyze_sessions(iter_sessions(log_dir, args.filename), args.jobs, lite=True)
+    if not sessions:
         print("No sessions found")
         return 1
 
@@ -487,14 +642,12 @@ def cmd_summary(args):
         'total_keystrokes': 0
     })
 
-    for log in logs:
-        session = analyze_session(log)
-        if session:
-            stats = file_stats[session['filename']]
-            stats['sessions'] += 1
-            stats['total_duration_ms'] += session['session_duration_ms']
-            stats['total_words'] += session['changes']['words']
-            stats['total_keystrokes'] += session['event_counts'].get('k', 0)
+    for session in sessions:
+        stats = file_stats[session['filename']]
+        stats['sessions'] += 1
+        stats['total_duration_ms'] += session['session_duration_ms']
+        stats['total_words'] += session['changes']['words']
+        stats['total_keystrokes'] += session['event_counts'].get('k', 0)
 
     # Print summary
     print("\nWRITECONTROL SUMMARY")
@@ -512,9 +665,9 @@ def cmd_summary(args):
 def cmd_list(args):
     """List tracked files"""
     log_dir = args.dir or get_default_log_dir()
-    logs = find_sessions(log_dir)
+    sessions = analyze_sessions(iter_sessions(log_dir), args.jobs, lite=True)
 
-    if not logs:
+    if not sessions:
         print("No sessions found")
         return 1
 
@@ -527,20 +680,18 @@ def cmd_list(args):
         'total_words': 0
     })
 
-    for log in logs:
-        session = analyze_session(log)
-        if session:
-            data = file_data[session['filename']]
-            session_time = datetime.strptime(session['session_date'], '%Y-%m-%d %H:%M')
+    for session in sessions:
+        data = file_data[session['filename']]
+        session_time = session['start_time']
 
-            data['sessions'].append(session)
-            data['total_duration_ms'] += session['session_duration_ms']
-            data['total_words'] += session['changes']['words']
+        data['sessions'].append(session)
+        data['total_duration_ms'] += session['session_duration_ms']
+        data['total_words'] += session['changes']['words']
 
-            if not data['first_seen'] or session_time < data['first_seen']:
-                data['first_seen'] = session_time
-            if not data['last_seen'] or session_time > data['last_seen']:
-                data['last_seen'] = session_time
+        if data['first_seen'] is None or session_time < data['first_seen']:
+            data['first_seen'] = session_time
+        if data['last_seen'] is None or session_time > data['last_seen']:
+            data['last_seen'] = session_time
 
     # Sort files
     items = list(file_data.items())
@@ -561,7 +712,7 @@ def cmd_list(args):
         print(f"{filename[:30]:<30} {len(data['sessions']):<10} "
               f"{format_time(data['total_duration_ms']):<15} "
               f"{data['total_words']:+d}".ljust(10) + " "
-              f"{data['last_seen'].strftime('%Y-%m-%d')}")
+              f"{strftime('%Y-%m-%d', localtime(data['last_seen']))}")
 
     return 0
 
@@ -578,20 +729,24 @@ def main():
     analyze_parser = subparsers.add_parser('analyze', help='Analyze session log')
     analyze_parser.add_argument('log_file', help='Path to log file')
     analyze_parser.add_argument('--all', action='store_true', help='Show all sessions for this file')
+    analyze_parser.add_argument('--jobs', type=int, help='Worker processes (default: CPU count)')
 
     # Process command
     process_parser = subparsers.add_parser('process', help='Generate commit message')
     process_parser.add_argument('log_files', nargs='+', help='Log files to process')
+    process_parser.add_argument('--jobs', type=int, help='Worker processes (default: CPU count)')
 
     # Summary command
     summary_parser = subparsers.add_parser('summary', help='Show summary statistics')
     summary_parser.add_argument('--filename', help='Filter by filename')
     summary_parser.add_argument('--dir', help='Log directory')
+    summary_parser.add_argument('--jobs', type=int, help='Worker processes (default: CPU count)')
 
     # List command
     list_parser = subparsers.add_parser('list', help='List tracked files')
     list_parser.add_argument('--dir', help='Log directory')
     list_parser.add_argument('--sort', choices=['date', 'words', 'duration'], default='date')
+    list_parser.add_argument('--jobs', type=int, help='Worker processes (default: CPU count)')
 
     args = parser.parse_args()
 